@@ -386,6 +386,31 @@ class Connection(options._OptionsMixin, abstract.AsyncIOExecutor):
             state=script.state and script.state.as_dict(),
         )
 
+    async def execute_batch(self, statements: typing.Sequence[str]) -> None:
+        """Execute a list of statements as a single script.
+
+        This is meant for merging what would otherwise be separate
+        execute() calls, each paying its own round-trip, into one
+        Execute/Sync exchange.  The server stops at the first failing
+        statement and never runs the remainder of the batch, so the
+        raised error is the one produced by the offending statement.
+        Outside of an explicit transaction the script runs in an
+        implicit transaction, so the effects of the statements preceding
+        the failing one are rolled back as well.
+        """
+        script = []
+        for stmt in statements:
+            stmt = stmt.rstrip()
+            if not stmt.strip():
+                continue
+            stmt = stmt.removesuffix(';')
+            # Always terminate on a separate line, in case the statement
+            # ends with a comment.
+            script.append(f'{stmt}\n;')
+
+        if script:
+            await self.execute('\n'.join(script))
+
     async def ensure_connected(self):
         if self.is_closed():
             await self.connect()
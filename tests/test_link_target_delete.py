@@ -284,6 +284,60 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
         self.assertTrue(success)
 
+    async def test_link_on_target_delete_restrict_08(self):
+        # The batch runs outside of an explicit transaction, so
+        # the failing DELETE must abort the rest of the batch and
+        # roll back the statements preceding it.
+        try:
+            with self.assertRaisesRegex(
+                    edgedb.ConstraintViolationError,
+                    'deletion of default::Target1 .* is prohibited by link'):
+                await self.con.execute_batch([
+                    """
+                        INSERT Target1 {
+                            name := 'Target8.1'
+                        };
+                    """,
+                    """
+                        INSERT Source1 {
+                            name := 'Source8.1',
+                            tgt1_restrict := (
+                                SELECT Target1
+                                FILTER .name = 'Target8.1'
+                            )
+                        };
+                    """,
+                    """
+                        DELETE (SELECT Target1 FILTER .name = 'Target8.1');
+                    """,
+                    """
+                        INSERT Target1 {
+                            name := 'Target8.2'
+                        };
+                    """,
+                ])
+
+            await self.assert_query_result(
+                r'''
+                    SELECT (
+                        target1 := count(
+                            Target1 FILTER .name LIKE 'Target8.%'),
+                        source1 := count(
+                            Source1 FILTER .name = 'Source8.1'),
+                    );
+                ''',
+                [{'target1': 0, 'source1': 0}],
+            )
+
+        finally:
+            # cleanup
+            await self.con.execute("""
+                DELETE (SELECT Source1
+                        FILTER .name = 'Source8.1');
+                DELETE (SELECT Target1
+                        FILTER .name LIKE 'Target8.%');
+            """)
+
     async def test_link_on_target_delete_deferred_restrict_01(self):
         exception_is_deferred = False
 
@@ -667,21 +721,14 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
             await self.assert_query_result(
                 r'''
-                    SELECT
-                        Source2
-                    FILTER
-                        .name = 'Source2.1';
-                ''',
-                []
-            )
-            await self.assert_query_result(
-                r'''
-                    SELECT
-                        Source1
-                    FILTER
-                        .name = 'Source1.1';
+                    SELECT (
+                        source2 := count(
+                            Source2 FILTER .name = 'Source2.1'),
+                        source1 := count(
+                            Source1 FILTER .name = 'Source1.1'),
+                    );
                 ''',
-                [],
+                [{'source2': 0, 'source1': 0}],
             )
 
             await self.con.execute("""
@@ -773,22 +820,14 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
             await self.assert_query_result(
                 r'''
-                    SELECT
-                        Source2
-                    FILTER
-                        .name = 'Source2.1';
-                ''',
-                [],
-            )
-
-            await self.assert_query_result(
-                r'''
-                    SELECT
-                        Source1
-                    FILTER
-                        .name LIKE 'Source1%';
+                    SELECT (
+                        source2 := count(
+                            Source2 FILTER .name = 'Source2.1'),
+                        source1 := count(
+                            Source1 FILTER .name LIKE 'Source1%'),
+                    );
                 ''',
-                [],
+                [{'source2': 0, 'source1': 0}],
             )
 
     async def test_link_on_target_delete_delete_source_03(self):
@@ -839,17 +878,9 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
             await self.assert_query_result(
                 r'''
-                    SELECT
-                        Source1 {
-                            name,
-                            tgt1_m2m_del_source: {
-                                name
-                            } ORDER BY .name
-                        }
-                    FILTER
-                        .name = 'Source1.1';
+                    SELECT count(Source1 FILTER .name = 'Source1.1');
                 ''',
-                []
+                [0]
             )
 
             await self.assert_query_result(
@@ -954,78 +985,70 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
             await self.assert_query_result(
                 r'''
-                    SELECT
-                        Source3
-                    FILTER
-                        .name LIKE 'Source3%';
+                    SELECT (
+                        source3 := count(
+                            Source3 FILTER .name LIKE 'Source3%'),
+                        source2 := count(
+                            Source2 FILTER .name = 'Source2.1'),
+                    );
                 ''',
-                [],
-            )
-
-            await self.assert_query_result(
-                r'''
-                    SELECT
-                        Source2
-                    FILTER
-                        .name = 'Source2.1';
-                ''',
-                [],
+                [{'source3': 0, 'source2': 0}],
             )
 
     async def test_link_on_target_delete_delete_source_05(self):
         async with self._run_and_rollback():
-            await self.con.execute("""
-                INSERT Target1 {
-                    name := 'Target1.1'
-                };
-
-                INSERT ChildSource1 {
-                    name := 'Source1.1',
-                    tgt1_del_source := (
-                        SELECT Target1
-                        FILTER .name = 'Target1.1'
-                    )
-                };
-            """)
-
-            await self.con.execute("""
-                DELETE (SELECT Target1 FILTER .name = 'Target1.1');
-            """)
+            await self.con.execute_batch([
+                """
+                    INSERT Target1 {
+                        name := 'Target1.1'
+                    };
+                """,
+                """
+                    INSERT ChildSource1 {
+                        name := 'Source1.1',
+                        tgt1_del_source := (
+                            SELECT Target1
+                            FILTER .name = 'Target1.1'
+                        )
+                    };
+                """,
+                """
+                    DELETE (SELECT Target1 FILTER .name = 'Target1.1');
+                """,
+            ])
 
             await self.assert_query_result(
                 r'''
-                    SELECT
-                        ChildSource1
-                    FILTER
-                        .name = 'Source1.1';
+                    SELECT count(ChildSource1 FILTER .name = 'Source1.1');
                 ''',
-                []
+                [0]
             )
 
     async def test_link_on_target_delete_loop_01(self):
         async with self._run_and_rollback():
-            await self.con.execute("""
-                insert Source1 {
-                    name := 'Source1.1',
-                    self_del_source := detached (
-                        insert Source1 {
-                            name := 'Source1.2',
-                            self_del_source := detached (
-                                insert Source1 { name := 'Source1.3' }
-                            )
-                        }
-                    )
-                };
-                update Source1 filter .name = 'Source1.3' set {
-                    self_del_source := detached (
-                        select Source1 filter .name = 'Source1.1'
-                    )
-                };
-            """)
-
-            await self.con.execute("""
-                delete Source1 filter .name = 'Source1.1'
-            """)
+            await self.con.execute_batch([
+                """
+                    insert Source1 {
+                        name := 'Source1.1',
+                        self_del_source := detached (
+                            insert Source1 {
+                                name := 'Source1.2',
+                                self_del_source := detached (
+                                    insert Source1 { name := 'Source1.3' }
+                                )
+                            }
+                        )
+                    };
+                    update Source1 filter .name = 'Source1.3' set {
+                        self_del_source := detached (
+                            select Source1 filter .name = 'Source1.1'
+                        )
+                    };
+                """,
+                """
+                    delete Source1 filter .name = 'Source1.1'
+                """,
+            ])
 
             await self.assert_query_result(
                 r'''
@@ -1036,22 +1059,23 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
     async def test_link_on_source_delete_01(self):
         async with self._run_and_rollback():
-            await self.con.execute("""
-                INSERT Source1 {
-                    name := 'Source1.1',
-                    tgt1_del_target := (
-                        INSERT Target1 {
-                            name := 'Target1.1',
-                            extra_tgt := (detached (
-                                INSERT Target1 { name := "t2" })),
-                        }
-                    )
-                };
-            """)
-
-            await self.con.execute("""
-                DELETE Source1 filter .name = 'Source1.1'
-            """)
+            await self.con.execute_batch([
+                """
+                    INSERT Source1 {
+                        name := 'Source1.1',
+                        tgt1_del_target := (
+                            INSERT Target1 {
+                                name := 'Target1.1',
+                                extra_tgt := (detached (
+                                    INSERT Target1 { name := "t2" })),
+                            }
+                        )
+                    };
+                """,
+                """
+                    DELETE Source1 filter .name = 'Source1.1'
+                """,
+            ])
 
             await self.assert_query_result(
                 r'''
@@ -1069,19 +1093,20 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
     async def test_link_on_source_delete_02(self):
         async with self._run_and_rollback():
-            await self.con.execute("""
-                INSERT Source1 {
-                    name := 'Source1.1',
-                    tgt1_m2m_del_target := {
-                        (INSERT Target1 {name := 'Target1.1'}),
-                        (INSERT Target1 {name := 'Target1.2'}),
-                    }
-                };
-            """)
-
-            await self.con.execute("""
-                DELETE Source1 filter .name = 'Source1.1'
-            """)
+            await self.con.execute_batch([
+                """
+                    INSERT Source1 {
+                        name := 'Source1.1',
+                        tgt1_m2m_del_target := {
+                            (INSERT Target1 {name := 'Target1.1'}),
+                            (INSERT Target1 {name := 'Target1.2'}),
+                        }
+                    };
+                """,
+                """
+                    DELETE Source1 filter .name = 'Source1.1'
+                """,
+            ])
 
             await self.assert_query_result(
                 r'''
@@ -1092,23 +1117,24 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
 
     async def test_link_on_source_delete_03(self):
         async with self._run_and_rollback():
-            await self.con.execute("""
-                INSERT Source1 {
-                    name := 'Source1.1',
-                    self_del_target := detached (
-                        insert Source1 {
-                            name := 'Source1.2',
-                            self_del_target := detached (
-                                insert Source1 { name := 'Source1.3' }
-                            )
-                        }
-                    )
-                };
-            """)
-
-            await self.con.execute("""
-                DELETE Source1 filter .name = 'Source1.1'
-            """)
+            await self.con.execute_batch([
+                """
+                    INSERT Source1 {
+                        name := 'Source1.1',
+                        self_del_target := detached (
+                            insert Source1 {
+                                name := 'Source1.2',
+                                self_del_target := detached (
+                                    insert Source1 { name := 'Source1.3' }
+                                )
+                            }
+                        )
+                    };
+                """,
+                """
+                    DELETE Source1 filter .name = 'Source1.1'
+                """,
+            ])
 
             await self.assert_query_result(
                 r'''
@@ -1141,11 +1167,12 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
                         )
                     }};
                 """
-                await self.con.execute(q)
-
-                await self.con.execute("""
-                    DELETE Source1 filter .name = 'Source1.1'
-                """)
+                await self.con.execute_batch([
+                    q,
+                    """
+                        DELETE Source1 filter .name = 'Source1.1'
+                    """,
+                ])
 
                 await self.assert_query_result(
                     r'''
@@ -1191,11 +1218,12 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
                         )
                     }};
                 """
-                await self.con.execute(q)
-
-                await self.con.execute("""
-                    DELETE Source1 filter .name = 'Source1.1'
-                """)
+                await self.con.execute_batch([
+                    q,
+                    """
+                        DELETE Source1 filter .name = 'Source1.1'
+                    """,
+                ])
 
                 await self.assert_query_result(
                     r'''
@@ -1218,28 +1246,29 @@ class TestLinkTargetDeleteDeclarative(stb.QueryTestCase):
                 )
 
     async def _cycle_test(self):
-        await self.con.execute("""
-            insert Source1 {
-                name := 'Source1.1',
-                self_del_target := detached (
-                    insert Source1 {
-                        name := 'Source1.2',
-                        self_del_target := detached (
-                            insert Source1 { name := 'Source1.3' }
-                        )
-                    }
-                )
-            };
-            update Source1 filter .name = 'Source1.3' set {
-                self_del_target := detached (
-                    select Source1 filter .name = 'Source1.1'
-                )
-            };
-        """)
-
-        await self.con.execute("""
-            delete Source1 filter .name = 'Source1.1'
-        """)
+        await self.con.execute_batch([
+            """
+                insert Source1 {
+                    name := 'Source1.1',
+                    self_del_target := detached (
+                        insert Source1 {
+                            name := 'Source1.2',
+                            self_del_target := detached (
+                                insert Source1 { name := 'Source1.3' }
+                            )
+                        }
+                    )
+                };
+                update Source1 filter .name = 'Source1.3' set {
+                    self_del_target := detached (
+                        select Source1 filter .name = 'Source1.1'
+                    )
+                };
+            """,
+            """
+                delete Source1 filter .name = 'Source1.1'
+            """,
+        ])
 
         await self.assert_query_result(
             r'''